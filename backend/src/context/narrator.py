@@ -526,14 +526,12 @@ def build_narrator_or_spell_prompt(
     from src.context.spell_llm import (
         build_spell_effect_prompt,
         build_spell_system_prompt,
-        is_spell_input,
         parse_spell_from_input,
     )
 
-    # Check if input is a spell cast
-    if is_spell_input(player_input):
-        spell_id, target = parse_spell_from_input(player_input)
-
+    # Check if input is a spell cast (parse once; a detected spell ID means a cast)
+    spell_id, target = parse_spell_from_input(player_input)
+    if spell_id is not None:
         # Build location context for spell
         location_context = {
             "description": location_desc,
@@ -14,13 +14,17 @@ Phase 5.7: Intent validation to reduce false positives.
 import logging
 import random
 import re
+from functools import lru_cache
 
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 
-from src.spells.definitions import SPELL_DEFINITIONS
+from src.spells.definitions import SPELL_DEFINITIONS, list_safe_spells
 
 logger = logging.getLogger(__name__)
 
+# Dedicated RNG for spell rolls (bound once; tests patch `_rand` instead of global random)
+_rand = random.Random().random
+
 # =============================================================================
 # Semantic Phrases for Single-Stage Spell Detection
 # =============================================================================
@@ -89,15 +93,34 @@ SPELL_SEMANTIC_PHRASES: dict[str, list[str]] = {
     ],
 }
 
-# 6 safe investigation spells (excludes Legilimency which uses trust-based system)
-SAFE_INVESTIGATION_SPELLS = {
-    "revelio",
-    "lumos",
+# 6 safe investigation spells (excludes Legilimency which uses trust-based system);
+# derived from the spell definitions so the two lists cannot drift apart
+SAFE_INVESTIGATION_SPELLS = frozenset(list_safe_spells())
+
+# Detection order: multi-word spell names first to avoid partial matches
+SPELL_DETECTION_ORDER = (
     "homenum_revelio",
     "specialis_revelio",
     "prior_incantato",
+    "legilimency",
+    "revelio",
+    "lumos",
     "reparo",
-}
+)
+
+# Per-spell match data in detection order, derived once at import:
+# (spell_id, lowercase name, id with spaces, semantic phrases, fuzzy-eligible phrases)
+_SPELL_MATCH_TABLE: tuple[tuple[str, str, str, tuple[str, ...], tuple[str, ...]], ...] = tuple(
+    (
+        spell_id,
+        SPELL_DEFINITIONS[spell_id]["name"].lower(),
+        spell_id.replace("_", " "),
+        tuple(SPELL_SEMANTIC_PHRASES.get(spell_id, [])),
+        tuple(p for p in SPELL_SEMANTIC_PHRASES.get(spell_id, []) if len(p) > 4),
+    )
+    for spell_id in SPELL_DETECTION_ORDER
+    if spell_id in SPELL_DEFINITIONS
+)
 
 # Intent phrases that grant +10% bonus
 INTENT_PHRASES = [
@@ -118,6 +141,51 @@ INTENT_PHRASES = [
 ]
 
 
+# Compiled patterns for parse_spell_from_input (matched against lowercased input)
+_CAST_PATTERN = re.compile(r"cast\s+(\w+(?:\s+\w+)?)\s*(?:on\s+(.+))?$")
+_CASTING_PATTERN = re.compile(r"i'm\s+casting\s+(\w+(?:\s+\w+)?)\s*(?:on\s+(.+))?$")
+
+# "on X" / "at X" spell target (everything after the preposition)
+_TARGET_PATTERN = re.compile(r"\b(?:on|at)\s+(.+)$", re.IGNORECASE)
+
+# Intent extraction patterns, in priority order (first pattern that matches wins)
+_INTENT_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"to\s+(?:find\s+out|learn|discover|see|know|understand|uncover|reveal)\s+about\s+(.+)$",
+        r"to\s+(?:find\s+out|learn|discover|see|know|understand|uncover|reveal)\s+(.+)$",
+        r"\babout\s+(.+)$",
+    )
+)
+
+# (spell_id, lowercase name) in definition order, for name normalization
+_SPELL_NAMES_LOWER: tuple[tuple[str, str], ...] = tuple(
+    (spell_id, spell_def["name"].lower()) for spell_id, spell_def in SPELL_DEFINITIONS.items()
+)
+
+# Lowercase spell name or spell ID -> spell ID, for bare-name input
+_SPELL_NAME_TO_ID: dict[str, str] = {
+    **{spell_id: spell_id for spell_id in SPELL_DEFINITIONS},
+    **{spell_name: spell_id for spell_id, spell_name in _SPELL_NAMES_LOWER},
+}
+
+# "[spell name] on [target]" for any known spell name, in one pass
+_SPELL_ON_PATTERN = re.compile(
+    r"^("
+    + "|".join(re.escape(name) for _, name in _SPELL_NAMES_LOWER)
+    + r")\s+on\s+(.+)$"
+)
+
+# Specificity bonus matchers: a targeting preposition + word, and any intent phrase
+# (the phrase alternation is a case-insensitive substring test, like `in`)
+_SPECIFICITY_TARGET_PATTERN = re.compile(
+    r"\b(?:on|at|toward|against|around|near|across|through|over|along)\s+\w+", re.IGNORECASE
+)
+_INTENT_PHRASE_PATTERN = re.compile(
+    "|".join(re.escape(phrase) for phrase in INTENT_PHRASES), re.IGNORECASE
+)
+
+
 # =============================================================================
 # Input Extraction Helpers
 # =============================================================================
@@ -143,17 +211,20 @@ def extract_target_from_input(text: str) -> str | None:
         >>> extract_target_from_input("use legilimency on hermione")
         'hermione'
     """
-    match = re.search(r"\b(?:on|at)\s+(.+)$", text, re.IGNORECASE)
+    match = _TARGET_PATTERN.search(text)
     if match:
         return match.group(1).strip()
 
     return None
 
 
+@lru_cache(maxsize=256)
 def extract_intent_from_input(text: str) -> str | None:
     """Extract search intent from Legilimency input.
 
     Simplified approach: detect strong intent verbs + capture everything after.
+    Cached: the Legilimency route and its success calculation both extract
+    intent from the same question.
 
     Patterns:
     - "to [verb] about X" where verb = find out, learn, discover, see, know, understand
@@ -176,14 +247,8 @@ def extract_intent_from_input(text: str) -> str | None:
         >>> extract_intent_from_input("legilimency about the crime")
         'the crime'
     """
-    patterns = [
-        r"to\s+(?:find\s+out|learn|discover|see|know|understand|uncover|reveal)\s+about\s+(.+)$",
-        r"to\s+(?:find\s+out|learn|discover|see|know|understand|uncover|reveal)\s+(.+)$",
-        r"\babout\s+(.+)$",
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in _INTENT_PATTERNS:
+        match = pattern.search(text)
         if match:
             return match.group(1).strip()
 
@@ -195,10 +260,29 @@ def extract_intent_from_input(text: str) -> str | None:
 # =============================================================================
 
 
+def _success_rate(base_rate: int, specificity_bonus: int, decline_penalty: int) -> int:
+    """Combine spell rate components into a success percentage (floor 10%).
+
+    Pure arithmetic shared by safe spells and Legilimency; the text-derived
+    bonus is computed by the caller so this never re-parses input.
+
+    Args:
+        base_rate: Spell's base success percentage
+        specificity_bonus: Bonus from target/intent in the player's input
+        decline_penalty: Penalty from repeated attempts
+
+    Returns:
+        Success percentage, never below 10
+    """
+    return max(10, base_rate + specificity_bonus - decline_penalty)
+
+
+@lru_cache(maxsize=256)
 def calculate_specificity_bonus(player_input: str) -> int:
     """Calculate specificity bonus (0%, +10%, or +20%).
 
     Rewards players for thoughtful spell usage with specific targets and intent.
+    Cached per input text, since recasts usually repeat the same phrasing.
 
     Args:
         player_input: Full player input text
@@ -216,12 +300,10 @@ def calculate_specificity_bonus(player_input: str) -> int:
     """
     bonus = 0
 
-    target_pattern = r"\b(?:on|at|toward|against|around|near|across|through|over|along)\s+\w+"
-    if re.search(target_pattern, player_input, re.IGNORECASE):
+    if _SPECIFICITY_TARGET_PATTERN.search(player_input):
         bonus += 10
 
-    input_lower = player_input.lower()
-    if any(phrase in input_lower for phrase in INTENT_PHRASES):
+    if _INTENT_PHRASE_PATTERN.search(player_input):
         bonus += 10
 
     return bonus
@@ -255,10 +337,9 @@ def calculate_spell_success(
     base_rate = 70
     specificity_bonus = calculate_specificity_bonus(player_input)
     decline_penalty = attempts_in_location * 10
-    success_rate = base_rate + specificity_bonus - decline_penalty
-    success_rate = max(10, success_rate)
+    success_rate = _success_rate(base_rate, specificity_bonus, decline_penalty)
 
-    roll = random.random() * 100
+    roll = _rand() * 100
     success = roll < success_rate
 
     logger.info(
@@ -323,10 +404,9 @@ def calculate_legilimency_success(
     base_rate = 30
     specificity_bonus = calculate_legilimency_specificity_bonus(player_input)
     decline_penalty = attempts_on_witness * 10
-    success_rate = base_rate + specificity_bonus - decline_penalty
-    success_rate = max(10, success_rate)
+    success_rate = _success_rate(base_rate, specificity_bonus, decline_penalty)
 
-    roll = random.random() * 100
+    roll = _rand() * 100
     success = roll < success_rate
 
     return success, success_rate, specificity_bonus, decline_penalty, roll
@@ -402,6 +482,26 @@ def _is_valid_spell_cast(
 # =============================================================================
 
 
+def _can_exceed_ratio(a: str, b: str, threshold: int) -> bool:
+    """Check whether fuzz.ratio(a, b) could possibly exceed threshold.
+
+    fuzz.ratio is bounded above by 200 * min(len) / (len_a + len_b), so
+    strings with very different lengths can be rejected without running
+    the edit-distance computation at all.
+
+    Args:
+        a: First string
+        b: Second string
+        threshold: Score (0-100) the ratio must exceed
+
+    Returns:
+        False if the lengths alone rule out a score above threshold
+    """
+    total = len(a) + len(b)
+    return total == 0 or 200 * min(len(a), len(b)) > threshold * total
+
+
+@lru_cache(maxsize=256)
 def detect_spell_with_fuzzy(text: str) -> tuple[str | None, str | None]:
     """Single-stage spell detection using fuzzy matching + semantic phrases.
 
@@ -411,6 +511,9 @@ def detect_spell_with_fuzzy(text: str) -> tuple[str | None, str | None]:
     Phase 5.7: Added intent validation to reduce false positives.
     Now requires action verb, target, or sentence-start position.
 
+    Pure function of the input text, so results are cached (players often
+    repeat the same cast verbatim).
+
     Priority order:
     1. Exact match multi-word spell names first (homenum revelio, etc.)
     2. Fuzzy match spell name (70% threshold for typos)
@@ -445,58 +548,29 @@ def detect_spell_with_fuzzy(text: str) -> tuple[str | None, str | None]:
     if text_lower.endswith("?"):
         return None, None
 
-    # Order spells with multi-word names first to avoid partial matches
-    spell_order = [
-        "homenum_revelio",
-        "specialis_revelio",
-        "prior_incantato",
-        "legilimency",
-        "revelio",
-        "lumos",
-        "reparo",
-    ]
-
     # Priority 1: Exact match multi-word spell names (before fuzzy)
-    for spell_id in spell_order:
-        spell_def = SPELL_DEFINITIONS.get(spell_id)
-        if not spell_def:
-            continue
-
-        spell_name = spell_def["name"].lower()
-
-        if spell_name in text_lower:
-            if _is_valid_spell_cast(text, spell_name, spell_id):
-                target = extract_target_from_input(text)
-                return spell_id, target
-
-        if spell_id.replace("_", " ") in text_lower:
+    for spell_id, spell_name, spaced_id, _, _ in _SPELL_MATCH_TABLE:
+        if spell_name in text_lower or spaced_id in text_lower:
             if _is_valid_spell_cast(text, spell_name, spell_id):
                 target = extract_target_from_input(text)
                 return spell_id, target
 
     # Priority 2: Fuzzy match spell name (handles typos)
-    for spell_id in spell_order:
-        spell_def = SPELL_DEFINITIONS.get(spell_id)
-        if not spell_def:
-            continue
-
-        spell_name = spell_def["name"].lower()
-
-        words = text_lower.split()
-        for word in words:
-            if fuzz.ratio(word, spell_name) > 70:
+    words = text_lower.split()
+    for spell_id, spell_name, _, _, _ in _SPELL_MATCH_TABLE:
+        # Score all plausible words in one RapidFuzz call, then check them in input order
+        candidates = [word for word in words if _can_exceed_ratio(word, spell_name, 70)]
+        matches = process.extract(
+            spell_name, candidates, scorer=fuzz.ratio, score_cutoff=70, limit=None
+        )
+        for word, score, _ in sorted(matches, key=lambda match: match[2]):
+            if score > 70:
                 if _is_valid_spell_cast(text, spell_name, spell_id, matched_word=word):
                     target = extract_target_from_input(text)
                     return spell_id, target
 
     # Priority 3: Semantic phrase match (exact substring)
-    for spell_id in spell_order:
-        spell_def = SPELL_DEFINITIONS.get(spell_id)
-        if not spell_def:
-            continue
-        spell_name = spell_def["name"].lower()
-
-        phrases = SPELL_SEMANTIC_PHRASES.get(spell_id, [])
+    for spell_id, spell_name, _, phrases, _ in _SPELL_MATCH_TABLE:
         for phrase in phrases:
             if phrase in text_lower:
                 if _is_valid_spell_cast(text, spell_name, spell_id):
@@ -504,16 +578,10 @@ def detect_spell_with_fuzzy(text: str) -> tuple[str | None, str | None]:
                     return spell_id, target
 
     # Priority 3.5: Fuzzy phrase match (catches typos like "reed her minde")
-    for spell_id in spell_order:
-        spell_def = SPELL_DEFINITIONS.get(spell_id)
-        if not spell_def:
-            continue
-        spell_name = spell_def["name"].lower()
-
-        phrases = SPELL_SEMANTIC_PHRASES.get(spell_id, [])
-        for phrase in phrases:
-            if len(phrase) > 4:
-                score = fuzz.ratio(text_lower, phrase)
+    for spell_id, spell_name, _, _, fuzzy_phrases in _SPELL_MATCH_TABLE:
+        for phrase in fuzzy_phrases:
+            if _can_exceed_ratio(text_lower, phrase, 65):
+                score = fuzz.ratio(text_lower, phrase, score_cutoff=65)
                 if score > 65:
                     if _is_valid_spell_cast(text, spell_name, spell_id):
                         target = extract_target_from_input(text)
@@ -541,10 +609,7 @@ def detect_focused_legilimency(text: str) -> tuple[bool, str | None]:
         (False, None)
     """
     intent = extract_intent_from_input(text)
-    if intent:
-        return True, intent
-    else:
-        return False, None
+    return (True, intent) if intent else (False, None)
 
 
 def parse_spell_from_input(player_input: str) -> tuple[str | None, str | None]:
@@ -566,32 +631,23 @@ def parse_spell_from_input(player_input: str) -> tuple[str | None, str | None]:
     input_lower = player_input.lower().strip()
 
     # Pattern 1: "cast [spell] on [target]" or "cast [spell]"
-    cast_pattern = r"cast\s+(\w+(?:\s+\w+)?)\s*(?:on\s+(.+))?$"
-    match = re.search(cast_pattern, input_lower)
-    if match:
-        spell_raw = match.group(1).strip()
-        target = match.group(2).strip() if match.group(2) else None
-        spell_id = _normalize_spell_name(spell_raw)
-        return spell_id, target
-
     # Pattern 2: "I'm casting [spell] on [target]" or "I'm casting [spell]"
-    casting_pattern = r"i'm\s+casting\s+(\w+(?:\s+\w+)?)\s*(?:on\s+(.+))?$"
-    match = re.search(casting_pattern, input_lower)
-    if match:
-        spell_raw = match.group(1).strip()
-        target = match.group(2).strip() if match.group(2) else None
-        spell_id = _normalize_spell_name(spell_raw)
-        return spell_id, target
+    for pattern in (_CAST_PATTERN, _CASTING_PATTERN):
+        match = pattern.search(input_lower)
+        if match:
+            spell_raw = match.group(1).strip()
+            target = match.group(2).strip() if match.group(2) else None
+            spell_id = _normalize_spell_name(spell_raw)
+            return spell_id, target
 
     # Pattern 3: Just spell name followed by "on [target]"
-    for spell_id in SPELL_DEFINITIONS:
-        spell_name = SPELL_DEFINITIONS[spell_id]["name"].lower()
-        spell_on_pattern = rf"^{re.escape(spell_name)}\s+on\s+(.+)$"
-        match = re.search(spell_on_pattern, input_lower)
-        if match:
-            return spell_id, match.group(1).strip()
-        if input_lower == spell_name or input_lower == spell_id:
-            return spell_id, None
+    match = _SPELL_ON_PATTERN.search(input_lower)
+    if match:
+        return _SPELL_NAME_TO_ID[match.group(1)], match.group(2).strip()
+
+    spell_id = _SPELL_NAME_TO_ID.get(input_lower)
+    if spell_id:
+        return spell_id, None
 
     return None, None
 
@@ -605,14 +661,15 @@ def _normalize_spell_name(spell_raw: str) -> str | None:
     Returns:
         Spell ID or None if not found
     """
-    spell_normalized = spell_raw.lower().replace(" ", "_")
+    raw_lower = spell_raw.lower()
+    spell_normalized = raw_lower.replace(" ", "_")
     if spell_normalized in SPELL_DEFINITIONS:
         return spell_normalized
 
-    for spell_id, spell_def in SPELL_DEFINITIONS.items():
-        if spell_def["name"].lower() == spell_raw.lower():
+    for spell_id, spell_name in _SPELL_NAMES_LOWER:
+        if spell_name == raw_lower:
             return spell_id
-        if spell_raw.lower() in spell_def["name"].lower():
+        if raw_lower in spell_name:
             return spell_id
 
     return None
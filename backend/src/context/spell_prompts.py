@@ -8,6 +8,49 @@ from typing import Any
 
 from src.spells.definitions import get_spell
 
+# Spell narrator persona - constant across casts, built once per process
+_SPELL_SYSTEM_PROMPT = """You are an immersive narrator for spell effects in a Harry Potter Auror investigation game.
+
+Your role:
+- Describe spell effects atmospherically but concisely (1-2 sentences max)
+- Reveal evidence ONLY when spell targets match the location's hidden evidence
+- Include [EVIDENCE: id] tags when a spell reveals evidence
+- Never invent evidence not defined in the allowed evidence list
+- For Legilimency: Give natural warnings before risky mind-reading attempts
+- Maintain mystery and tension appropriate for a detective story
+
+Style:
+- Second person present tense ("Your wand glows...", "The spell reveals...")
+- Evocative but brief descriptions
+- Harry Potter universe vocabulary and atmosphere
+- Professional Auror training tone"""
+
+# Narration rules shared by every spell effect prompt
+_SPELL_EFFECT_RULES = """== RULES ==
+1. IMPORTANT: Check SPELL OUTCOME first!
+   - If outcome is "FAILURE" -> "The spell fizzles and dissipates. Nothing revealed." (regardless of target)
+   - If outcome is "SUCCESS" -> proceed to evidence revelation rules below
+   - If outcome is not specified -> use old behavior (treat as always succeeds)
+2. On SUCCESS: If target matches valid targets AND undiscovered evidence exists -> reveal with [EVIDENCE: id] tag
+3. MAXIMUM 2 evidence per spell cast. Even if more evidence is available, reveal at most 2.
+4. On SUCCESS: If target is valid but no undiscovered evidence -> describe atmospheric spell effect only
+5. On SUCCESS: If target is not in valid targets list -> "The spell finds nothing of note here."
+6. Keep responses to 2-4 sentences - atmospheric but concise
+7. NEVER invent evidence not in the revealable list
+8. Stay in character as immersive Auror training narrator
+9. NEVER mention mechanical terms like "roll", "percentage", "success rate" - describe naturally"""
+
+# Static outcome sections for spell prompts; None covers legacy/unknown outcomes
+_SPELL_OUTCOME_SECTIONS: dict[str | None, str] = {
+    "SUCCESS": """Outcome: SUCCESS
+The spell executes successfully. Proceed with evidence revelation rules below.""",
+    "FAILURE": """Outcome: FAILURE
+The spell fails to manifest properly. The charm sputters and fades.
+Response: Describe the spell fizzling out atmospherically. NO evidence revealed regardless of target.""",
+    None: """Outcome: Not calculated (legacy flow)
+Use old behavior - treat spell as always succeeding, check target validity for evidence.""",
+}
+
 
 def build_legilimency_narration_prompt(
     outcome: str,
@@ -72,7 +115,8 @@ These are the memories/knowledge you discover. Weave them into the narrative org
 
     evidence_context = ""
     if outcome == "success" and available_evidence:
-        undiscovered = [e for e in available_evidence if e.get("id") not in discovered_evidence]
+        discovered_ids = set(discovered_evidence)
+        undiscovered = [e for e in available_evidence if e.get("id") not in discovered_ids]
         if undiscovered:
             evidence_list = "\n".join(
                 [
@@ -183,24 +227,12 @@ Respond as narrator:"""
 def build_spell_system_prompt() -> str:
     """Build system prompt for spell effect narrator.
 
+    The prompt is input-independent, so it is rendered once at import time.
+
     Returns:
         System prompt setting spell narrator persona
     """
-    return """You are an immersive narrator for spell effects in a Harry Potter Auror investigation game.
-
-Your role:
-- Describe spell effects atmospherically but concisely (1-2 sentences max)
-- Reveal evidence ONLY when spell targets match the location's hidden evidence
-- Include [EVIDENCE: id] tags when a spell reveals evidence
-- Never invent evidence not defined in the allowed evidence list
-- For Legilimency: Give natural warnings before risky mind-reading attempts
-- Maintain mystery and tension appropriate for a detective story
-
-Style:
-- Second person present tense ("Your wand glows...", "The spell reveals...")
-- Evocative but brief descriptions
-- Harry Potter universe vocabulary and atmosphere
-- Professional Auror training tone"""
+    return _SPELL_SYSTEM_PROMPT
 
 
 def build_spell_effect_prompt(
@@ -236,7 +268,8 @@ def build_spell_effect_prompt(
     valid_targets = spell_interaction.get("targets", [])
     reveals_evidence = spell_interaction.get("reveals_evidence", [])
 
-    undiscovered_evidence = [e for e in reveals_evidence if e not in discovered_evidence][:2]
+    discovered_ids = set(discovered_evidence)
+    undiscovered_evidence = [e for e in reveals_evidence if e not in discovered_ids][:2]
 
     evidence_section = _format_revealable_evidence(
         undiscovered_evidence,
@@ -246,7 +279,7 @@ def build_spell_effect_prompt(
 
     outcome_section = _build_spell_outcome_section(spell_outcome)
 
-    prompt = f"""You are narrating the effect of a spell in an Auror investigation.
+    return f"""You are narrating the effect of a spell in an Auror investigation.
 
 == SPELL CAST ==
 Spell: {spell["name"]}
@@ -269,29 +302,13 @@ Target: {target or "general area"}
 == ALREADY DISCOVERED (do not repeat) ==
 {", ".join(discovered_evidence) if discovered_evidence else "None"}
 
-== RULES ==
-1. IMPORTANT: Check SPELL OUTCOME first!
-   - If outcome is "FAILURE" -> "The spell fizzles and dissipates. Nothing revealed." (regardless of target)
-   - If outcome is "SUCCESS" -> proceed to evidence revelation rules below
-   - If outcome is not specified -> use old behavior (treat as always succeeds)
-2. On SUCCESS: If target matches valid targets AND undiscovered evidence exists -> reveal with [EVIDENCE: id] tag
-3. MAXIMUM 2 evidence per spell cast. Even if more evidence is available, reveal at most 2.
-4. On SUCCESS: If target is valid but no undiscovered evidence -> describe atmospheric spell effect only
-5. On SUCCESS: If target is not in valid targets list -> "The spell finds nothing of note here."
-6. Keep responses to 2-4 sentences - atmospheric but concise
-7. NEVER invent evidence not in the revealable list
-8. Stay in character as immersive Auror training narrator
-9. NEVER mention mechanical terms like "roll", "percentage", "success rate" - describe naturally
-"""
+{_SPELL_EFFECT_RULES}
 
-    prompt += f"""
 == PLAYER CAST ==
 Player casts {spell["name"]}{f" on {target}" if target else ""}.
 
 Respond as the narrator (2-4 sentences):"""
 
-    return prompt
-
 
 def _build_spell_outcome_section(spell_outcome: str | None) -> str:
     """Build spell outcome section for prompt.
@@ -302,16 +319,7 @@ def _build_spell_outcome_section(spell_outcome: str | None) -> str:
     Returns:
         Formatted outcome section
     """
-    if spell_outcome == "SUCCESS":
-        return """Outcome: SUCCESS
-The spell executes successfully. Proceed with evidence revelation rules below."""
-    elif spell_outcome == "FAILURE":
-        return """Outcome: FAILURE
-The spell fails to manifest properly. The charm sputters and fades.
-Response: Describe the spell fizzling out atmospherically. NO evidence revealed regardless of target."""
-    else:
-        return """Outcome: Not calculated (legacy flow)
-Use old behavior - treat spell as always succeeding, check target validity for evidence."""
+    return _SPELL_OUTCOME_SECTIONS.get(spell_outcome, _SPELL_OUTCOME_SECTIONS[None])
 
 
 def _build_unknown_spell_prompt(spell_name: str) -> str:
@@ -10,6 +10,7 @@ Pressure = inability to maintain lies under evidence weight. Both axes
 interact naturally — LLM decides behavior from examples, not rigid labels.
 """
 
+from functools import lru_cache
 from typing import Any
 
 from src.spells.definitions import get_spell
@@ -73,15 +74,11 @@ def format_conversation_history(history: list[dict[str, Any]]) -> str:
     if not history:
         return "This is the start of the conversation."
 
-    lines = []
-    for item in history[-20:]:  # Last 20 exchanges
-        question = item.get("question", "")
-        response = item.get("response", "")
-        lines.append(f"Player: {question}")
-        lines.append(f"You: {response}")
-        lines.append("")
-
-    return "\n".join(lines)
+    # Last 20 exchanges, each followed by a blank line
+    return "\n".join(
+        f"Player: {item.get('question', '')}\nYou: {item.get('response', '')}\n"
+        for item in history[-20:]
+    )
 
 
 def format_evidence_shown(evidence_shown_details: list[dict[str, Any]]) -> str:
@@ -189,15 +186,16 @@ def build_witness_prompt(
         crime_type = case_context.get("crime_type", "")
         location = case_context.get("location", "")
 
-        if victim_name or crime_type or location:
-            case_info = "\n== CASE CONTEXT (public knowledge) ==\n"
-            if victim_name:
-                case_info += f"Victim: {victim_name}\n"
-            if crime_type:
-                case_info += f"What happened: {crime_type}\n"
-            if location:
-                case_info += f"Where: {location}\n"
-            case_info += "\n"
+        case_lines = []
+        if victim_name:
+            case_lines.append(f"Victim: {victim_name}")
+        if crime_type:
+            case_lines.append(f"What happened: {crime_type}")
+        if location:
+            case_lines.append(f"Where: {location}")
+
+        if case_lines:
+            case_info = "\n".join(["\n== CASE CONTEXT (public knowledge) ==", *case_lines, "\n"])
 
     # Format sections
     knowledge_text = format_knowledge(knowledge)
@@ -277,8 +275,9 @@ Player: "{player_input}"
 Respond as {name}:"""
 
 
+@lru_cache(maxsize=64)
 def build_witness_system_prompt(witness_name: str) -> str:
-    """Build system prompt for witness."""
+    """Build system prompt for witness (cached per witness name)."""
     return f"""You are {witness_name} in a Harry Potter investigation game. \
 First person, 2-4 sentences, in character. Never break the fourth wall. \
 Use spaces around em dashes ( — not —).
@@ -57,6 +57,16 @@ SPELL_DEFINITIONS: dict[str, dict[str, Any]] = {
     },
 }
 
+# Derived ID groupings, computed once (definitions are static)
+_SAFE_SPELL_IDS: tuple[str, ...] = tuple(
+    spell_id for spell_id, spell in SPELL_DEFINITIONS.items() if spell.get("safety_level") == "safe"
+)
+_RESTRICTED_SPELL_IDS: frozenset[str] = frozenset(
+    spell_id
+    for spell_id, spell in SPELL_DEFINITIONS.items()
+    if spell.get("safety_level") == "restricted"
+)
+
 
 def get_spell(spell_id: str) -> dict[str, Any] | None:
     """Get spell definition by ID.
@@ -79,10 +89,7 @@ def is_restricted_spell(spell_id: str) -> bool:
     Returns:
         True if spell is restricted, False otherwise
     """
-    spell = get_spell(spell_id)
-    if spell is None:
-        return False
-    return spell.get("safety_level") == "restricted"
+    return spell_id.lower() in _RESTRICTED_SPELL_IDS
 
 
 def list_safe_spells() -> list[str]:
@@ -91,11 +98,7 @@ def list_safe_spells() -> list[str]:
     Returns:
         List of safe spell IDs
     """
-    return [
-        spell_id
-        for spell_id, spell in SPELL_DEFINITIONS.items()
-        if spell.get("safety_level") == "safe"
-    ]
+    return list(_SAFE_SPELL_IDS)
 
 
 def list_all_spells() -> list[str]:
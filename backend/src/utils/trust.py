@@ -6,7 +6,10 @@ Phase 7: LLM-driven trust via [TRUST_DELTA: N] tags piggybacked on witness respo
 
 import logging
 import re
+from collections.abc import Collection, Mapping
 from difflib import SequenceMatcher
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -24,6 +27,13 @@ TRUST_DELTA_STRIP_RE = re.compile(
 # Requires opening bracket to avoid false positives on normal text containing "T"
 TRUST_DELTA_TAG_PARTIAL_RE = re.compile(r"\s*\[T(?:R(?:U(?:S(?:T(?:_(?:D(?:E(?:L(?:T(?:A)?)?)?)?)?)?)?)?)?)?:?\s*[^\]]*$", re.IGNORECASE)
 
+# Secret trigger grammar: OR binds looser than AND; conditions match as prefixes
+_OR_SPLIT_RE = re.compile(r"\s+OR\s+", re.IGNORECASE)
+_AND_SPLIT_RE = re.compile(r"\s+AND\s+", re.IGNORECASE)
+_EVIDENCE_COUNT_CONDITION_RE = re.compile(r"evidence_count\s*([<>=!]+)\s*(\d+)", re.IGNORECASE)
+_TRUST_CONDITION_RE = re.compile(r"trust\s*([<>])\s*(\d+)", re.IGNORECASE)
+_EVIDENCE_CONDITION_RE = re.compile(r"evidence:(\w+)", re.IGNORECASE)
+
 # Clamping range for LLM-provided trust deltas (symmetric)
 TRUST_DELTA_MIN = -15
 TRUST_DELTA_MAX = 10
@@ -99,9 +109,13 @@ def clamp_trust(trust: int) -> int:
     return max(MIN_TRUST, min(MAX_TRUST, trust))
 
 
-def parse_trigger_condition(trigger: str) -> list[dict[str, Any]]:
+@lru_cache(maxsize=256)
+def parse_trigger_condition(trigger: str) -> tuple[Mapping[str, Any], ...]:
     """Parse trigger string into evaluable conditions.
 
+    Parses are cached per trigger string, so the result is read-only: a tuple of
+    MappingProxyType condition groups, each holding a tuple of read-only conditions.
+
     Supports:
     - "trust>N" or "trust<N" (trust threshold)
     - "evidence:X" (requires evidence)
@@ -112,16 +126,16 @@ def parse_trigger_condition(trigger: str) -> list[dict[str, Any]]:
         trigger: Trigger string (e.g., "evidence:frost_pattern OR trust>70")
 
     Returns:
-        List of condition dicts with type, operator, value
+        Tuple of read-only condition mappings with type, operator, value
     """
-    conditions: list[dict[str, Any]] = []
+    conditions: list[Mapping[str, Any]] = []
 
     # Split by OR first (lower precedence)
-    or_parts = re.split(r"\s+OR\s+", trigger, flags=re.IGNORECASE)
+    or_parts = _OR_SPLIT_RE.split(trigger)
 
     for or_part in or_parts:
         # Split by AND (higher precedence)
-        and_parts = re.split(r"\s+AND\s+", or_part, flags=re.IGNORECASE)
+        and_parts = _AND_SPLIT_RE.split(or_part)
         and_conditions: list[dict[str, Any]] = []
 
         for part in and_parts:
@@ -129,7 +143,7 @@ def parse_trigger_condition(trigger: str) -> list[dict[str, Any]]:
 
             # Parse evidence_count condition: evidence_count>N, evidence_count>=N, etc.
             # Must check BEFORE trust to avoid matching "trust" in evidence_count
-            count_match = re.match(r"evidence_count\s*([<>=!]+)\s*(\d+)", part, re.IGNORECASE)
+            count_match = _EVIDENCE_COUNT_CONDITION_RE.match(part)
             if count_match:
                 and_conditions.append(
                     {
@@ -141,7 +155,7 @@ def parse_trigger_condition(trigger: str) -> list[dict[str, Any]]:
                 continue
 
             # Parse trust condition: trust>N or trust<N
-            trust_match = re.match(r"trust\s*([<>])\s*(\d+)", part, re.IGNORECASE)
+            trust_match = _TRUST_CONDITION_RE.match(part)
             if trust_match:
                 and_conditions.append(
                     {
@@ -153,7 +167,7 @@ def parse_trigger_condition(trigger: str) -> list[dict[str, Any]]:
                 continue
 
             # Parse evidence condition: evidence:X
-            evidence_match = re.match(r"evidence:(\w+)", part, re.IGNORECASE)
+            evidence_match = _EVIDENCE_CONDITION_RE.match(part)
             if evidence_match:
                 and_conditions.append(
                     {
@@ -165,19 +179,21 @@ def parse_trigger_condition(trigger: str) -> list[dict[str, Any]]:
 
         if and_conditions:
             conditions.append(
-                {
-                    "type": "and_group",
-                    "conditions": and_conditions,
-                }
+                MappingProxyType(
+                    {
+                        "type": "and_group",
+                        "conditions": tuple(MappingProxyType(c) for c in and_conditions),
+                    }
+                )
             )
 
-    return conditions
+    return tuple(conditions)
 
 
 def evaluate_condition(
-    condition: dict[str, Any],
+    condition: Mapping[str, Any],
     trust: int,
-    discovered_evidence: list[str],
+    discovered_evidence: Collection[str],
     evidence_count: int | None = None,
 ) -> bool:
     """Evaluate a single parsed condition.
@@ -185,7 +201,7 @@ def evaluate_condition(
     Args:
         condition: Parsed condition dict
         trust: Current trust level
-        discovered_evidence: List of discovered evidence IDs
+        discovered_evidence: Discovered evidence IDs (list or set)
         evidence_count: Optional explicit evidence count (defaults to len(discovered_evidence))
 
     Returns:
@@ -238,6 +254,33 @@ def evaluate_condition(
     return False
 
 
+def _trigger_met(
+    trigger: str,
+    trust: int,
+    evidence_ids: frozenset[str],
+    evidence_count: int,
+) -> bool:
+    """Evaluate a trigger string against a prepared evidence set.
+
+    Args:
+        trigger: Secret trigger string
+        trust: Current trust level (0-100)
+        evidence_ids: Discovered evidence IDs as a set for O(1) membership
+        evidence_count: Number of discovered evidence entries
+
+    Returns:
+        True if any OR group of the trigger is satisfied
+    """
+    if not trigger:
+        return False
+
+    # OR logic: any condition group being true triggers the secret
+    return any(
+        evaluate_condition(cond, trust, evidence_ids, evidence_count)
+        for cond in parse_trigger_condition(trigger)
+    )
+
+
 def check_secret_triggers(
     secret: dict[str, Any],
     trust: int,
@@ -253,14 +296,12 @@ def check_secret_triggers(
     Returns:
         True if trigger conditions are met and secret should be revealed
     """
-    trigger = secret.get("trigger", "")
-    if not trigger:
-        return False
-
-    conditions = parse_trigger_condition(trigger)
-
-    # OR logic: any condition group being true triggers the secret
-    return any(evaluate_condition(cond, trust, discovered_evidence) for cond in conditions)
+    return _trigger_met(
+        secret.get("trigger", ""),
+        trust,
+        frozenset(discovered_evidence),
+        len(discovered_evidence),
+    )
 
 
 def get_available_secrets(
@@ -279,7 +320,13 @@ def get_available_secrets(
         List of secrets whose trigger conditions are met
     """
     secrets = witness.get("secrets", [])
-    return [s for s in secrets if check_secret_triggers(s, trust, discovered_evidence)]
+    evidence_ids = frozenset(discovered_evidence)
+    evidence_count = len(discovered_evidence)
+    return [
+        s
+        for s in secrets
+        if _trigger_met(s.get("trigger", ""), trust, evidence_ids, evidence_count)
+    ]
 
 
 def should_lie(
@@ -305,7 +352,7 @@ def should_lie(
         topics = lie.get("topics", [])
 
         # Parse trust condition from lie (e.g., "trust<30")
-        trust_match = re.match(r"trust\s*([<>])\s*(\d+)", condition, re.IGNORECASE)
+        trust_match = _TRUST_CONDITION_RE.match(condition)
         if not trust_match:
             continue
 
@@ -380,10 +427,8 @@ def _token_overlap_score(
     return matched / len(name_tokens)
 
 
-# Verb patterns that signal explicit evidence presentation intent
-_PRESENTATION_VERBS = re.compile(
-    r"\b(show|present|give|reveal|hand|display)\b", re.IGNORECASE,
-)
+# Verb patterns that signal explicit evidence presentation intent (matched on lowered input)
+_PRESENTATION_VERBS = re.compile(r"\b(show|present|give|reveal|hand|display)\b")
 
 # Minimum token overlap required (fraction of evidence name tokens matched)
 _MIN_OVERLAP_MULTI = 0.5    # multi-word names: at least half the tokens
@@ -420,7 +465,7 @@ def detect_evidence_in_message(
 
     input_lower = player_input.lower()
     input_tokens = _tokenize(player_input)
-    has_verb = bool(_PRESENTATION_VERBS.search(player_input))
+    has_verb = bool(_PRESENTATION_VERBS.search(input_lower))
 
     evidence_objs = _get_discovered_evidence_objs(discovered_evidence, case_data)
 
@@ -2,6 +2,15 @@
 
 from typing import Any
 
+# Connectors that show logical structure between sentences
+_LOGICAL_WORDS = ("because", "therefore", "since", "thus", "so", "hence")
+
+# Hedging phrases penalized once each when present
+_VAGUE_PHRASES = ("i guess", "maybe", "probably", "i think", "seems like", "kind of")
+
+# Hint level indexed by attempts remaining (clamped to 0-10)
+_HINT_LEVELS = ("direct",) * 4 + ("specific",) * 3 + ("harsh",) * 4
+
 
 def check_verdict(
     accused_suspect_id: str,
@@ -32,7 +41,7 @@ def score_reasoning(
     - Base: 20 (just for attempting with 50+ chars)
     - Evidence: +40 max (must cite CRITICAL evidence)
     - Coherence: +20 (2-5 sentences with logical connectors)
-    - Penalties: fallacies (-20 each), vague language (-10 each), no causal words (-15)
+    - Penalties: fallacies (-20 each distinct), vague language (-10 each), no causal words (-15)
 
     Args:
         reasoning: Player's reasoning text
@@ -53,18 +62,20 @@ def score_reasoning(
         return 5  # Minimal effort = minimal score
 
     # Evidence citation (STRICT - must cite CRITICAL evidence)
-    solution_key_evidence = solution.get("key_evidence", [])
-    critical_cited = [e for e in key_evidence_mentioned if e in solution_key_evidence]
+    solution_key_evidence = frozenset(solution.get("key_evidence", []))
+    critical_cited = sum(1 for e in key_evidence_mentioned if e in solution_key_evidence)
 
-    if len(critical_cited) == 0:
+    if critical_cited == 0:
         score -= 30  # HEAVY penalty for no critical evidence
-    elif len(critical_cited) == 1:
+    elif critical_cited == 1:
         score += 10  # Cited SOME critical evidence
-    elif len(critical_cited) == 2:
+    elif critical_cited == 2:
         score += 25  # Cited MOST critical evidence
     else:
         score += 40  # Cited ALL critical evidence
 
+    reasoning_lower = reasoning.lower()
+
     # Coherence (STRICT - check for actual logical structure)
     sentence_count = _count_sentences(reasoning)
 
@@ -74,23 +85,20 @@ def score_reasoning(
         score -= 15  # Too rambling
     elif 2 <= sentence_count <= 5:
         # Check for logical connectors (because, therefore, since, etc.)
-        logical_words = ["because", "therefore", "since", "thus", "so", "hence"]
-        has_logic = any(word in reasoning.lower() for word in logical_words)
+        has_logic = any(word in reasoning_lower for word in _LOGICAL_WORDS)
         if has_logic:
             score += 20  # Good structure
         else:
             score += 5  # Sentences exist but no logical flow
 
-    # Fallacy penalties (HARSH)
-    score -= len(fallacies_detected) * 20  # Up from -15
+    # Fallacy penalties (HARSH) - each distinct fallacy counts once
+    score -= len(set(fallacies_detected)) * 20  # Up from -15
 
     # Vague language penalty (NEW)
-    vague_words = ["i guess", "maybe", "probably", "i think", "seems like", "kind of"]
-    vague_count = sum(1 for word in vague_words if word in reasoning.lower())
+    vague_count = sum(1 for phrase in _VAGUE_PHRASES if phrase in reasoning_lower)
     score -= vague_count * 10
 
     # No explanation penalty (NEW)
-    reasoning_lower = reasoning.lower()
     if "because" not in reasoning_lower and "since" not in reasoning_lower:
         score -= 15  # No causal reasoning
 
@@ -107,20 +115,17 @@ def _count_sentences(text: str) -> int:
     Returns:
         Number of sentences
     """
-    if not text or not text.strip():
+    text_stripped = text.strip()
+    if not text_stripped:
         return 0
 
-    count = 0
-    for char in text:
-        if char in ".!?":
-            count += 1
+    count = text.count(".") + text.count("!") + text.count("?")
 
     # Handle edge case where text ends without terminal punctuation
-    text_stripped = text.strip()
-    if text_stripped and text_stripped[-1] not in ".!?":
+    if text_stripped[-1] not in ".!?":
         count += 1
 
-    return max(count, 1) if text.strip() else 0
+    return count
 
 
 def calculate_attempts_hint_level(attempts_remaining: int) -> str:
@@ -132,9 +137,4 @@ def calculate_attempts_hint_level(attempts_remaining: int) -> str:
     Returns:
         "harsh" (7-10 left), "specific" (4-6 left), "direct" (1-3 left)
     """
-    if attempts_remaining >= 7:
-        return "harsh"
-    elif attempts_remaining >= 4:
-        return "specific"
-    else:
-        return "direct"
+    return _HINT_LEVELS[max(0, min(attempts_remaining, 10))]
@@ -7,6 +7,7 @@ from typing import Any
 
 import pytest
 
+from src.case_store.loader import load_case
 from src.state.player_state import PlayerState
 
 # Add src to path for imports
@@ -116,3 +117,9 @@ def disable_rate_limiting() -> None:
     limiter.enabled = False
     yield
     limiter.enabled = True
+
+
+@pytest.fixture(scope="session")
+def case_001_data() -> dict[str, Any]:
+    """Parsed case_001 YAML, loaded once per session. Treat as read-only."""
+    return load_case("case_001")
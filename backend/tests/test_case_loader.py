@@ -1,5 +1,8 @@
 """Tests for case loader module."""
 
+import copy
+from typing import Any
+
 import pytest
 
 from src.case_store.loader import (
@@ -19,6 +22,12 @@ from src.case_store.loader import (
 )
 
 
+@pytest.fixture
+def case_001_copy(case_001_data: dict[str, Any]) -> dict[str, Any]:
+    """Private copy of case_001 for loaders that fill in defaults (e.g. get_location)."""
+    return copy.deepcopy(case_001_data)
+
+
 class TestLoadCase:
     """Tests for load_case function."""
 
@@ -46,29 +55,26 @@ class TestLoadCase:
 class TestGetLocation:
     """Tests for get_location function."""
 
-    def test_get_library_location(self) -> None:
+    def test_get_library_location(self, case_001_copy: dict[str, Any]) -> None:
         """Get library location data."""
-        case_data = load_case("case_001")
-        location = get_location(case_data, "library")
+        location = get_location(case_001_copy, "library")
 
         assert location["id"] == "library"
         assert location["name"] == "Restricted Section"
         assert "description" in location
 
-    def test_location_has_description_multiline(self) -> None:
+    def test_location_has_description_multiline(self, case_001_copy: dict[str, Any]) -> None:
         """Location description has multiple lines (YAML pipe)."""
-        case_data = load_case("case_001")
-        location = get_location(case_data, "library")
+        location = get_location(case_001_copy, "library")
 
         description = location["description"]
         assert "\n" in description
         # Description should have substantive content
         assert len(description) > 50
 
-    def test_location_has_hidden_evidence(self) -> None:
+    def test_location_has_hidden_evidence(self, case_001_copy: dict[str, Any]) -> None:
         """Location has hidden evidence list."""
-        case_data = load_case("case_001")
-        location = get_location(case_data, "library")
+        location = get_location(case_001_copy, "library")
 
         assert "hidden_evidence" in location
         evidence_list = location["hidden_evidence"]
@@ -80,10 +86,9 @@ class TestGetLocation:
         assert "discovery_guidance" in first_evidence
         assert "description" in first_evidence
 
-    def test_location_has_not_present_items(self) -> None:
+    def test_location_has_not_present_items(self, case_001_copy: dict[str, Any]) -> None:
         """Location has not_present items for hallucination prevention."""
-        case_data = load_case("case_001")
-        location = get_location(case_data, "library")
+        location = get_location(case_001_copy, "library")
 
         assert "not_present" in location
         not_present = location["not_present"]
@@ -94,12 +99,10 @@ class TestGetLocation:
         assert "triggers" in first_item
         assert "response" in first_item
 
-    def test_get_nonexistent_location_raises(self) -> None:
+    def test_get_nonexistent_location_raises(self, case_001_copy: dict[str, Any]) -> None:
         """KeyError for missing location."""
-        case_data = load_case("case_001")
-
         with pytest.raises(KeyError):
-            get_location(case_data, "nonexistent_room")
+            get_location(case_001_copy, "nonexistent_room")
 
 
 class TestListCases:
@@ -122,10 +125,9 @@ class TestListCases:
 class TestEvidenceStructure:
     """Tests for evidence data structure."""
 
-    def test_evidence_has_required_fields(self) -> None:
+    def test_evidence_has_required_fields(self, case_001_copy: dict[str, Any]) -> None:
         """Each evidence has id, discovery_guidance, description."""
-        case_data = load_case("case_001")
-        location = get_location(case_data, "library")
+        location = get_location(case_001_copy, "library")
 
         for evidence in location["hidden_evidence"]:
             assert "id" in evidence, f"Evidence missing 'id': {evidence}"
@@ -134,19 +136,19 @@ class TestEvidenceStructure:
             assert isinstance(evidence["discovery_guidance"], str)
             assert len(evidence["discovery_guidance"]) >= 1
 
-    def test_evidence_discovery_guidance_is_descriptive(self) -> None:
+    def test_evidence_discovery_guidance_is_descriptive(
+        self, case_001_copy: dict[str, Any]
+    ) -> None:
         """Discovery guidance describes how evidence is found."""
-        case_data = load_case("case_001")
-        location = get_location(case_data, "library")
+        location = get_location(case_001_copy, "library")
 
         for evidence in location["hidden_evidence"]:
             guidance = evidence["discovery_guidance"]
             assert len(guidance) > 10, f"Evidence {evidence['id']} has too short guidance"
 
-    def test_hidden_note_evidence_exists(self) -> None:
+    def test_hidden_note_evidence_exists(self, case_001_copy: dict[str, Any]) -> None:
         """hidden_note evidence with desk discovery guidance."""
-        case_data = load_case("case_001")
-        location = get_location(case_data, "library")
+        location = get_location(case_001_copy, "library")
 
         evidence_ids = [e["id"] for e in location["hidden_evidence"]]
         assert "hidden_note" in evidence_ids
@@ -154,10 +156,9 @@ class TestEvidenceStructure:
         hidden_note = next(e for e in location["hidden_evidence"] if e["id"] == "hidden_note")
         assert "desk" in hidden_note["discovery_guidance"].lower()
 
-    def test_wand_signature_evidence_exists(self) -> None:
+    def test_wand_signature_evidence_exists(self, case_001_copy: dict[str, Any]) -> None:
         """wand_signature evidence with Prior Incantato discovery guidance."""
-        case_data = load_case("case_001")
-        location = get_location(case_data, "library")
+        location = get_location(case_001_copy, "library")
 
         evidence_ids = [e["id"] for e in location["hidden_evidence"]]
         assert "wand_signature" in evidence_ids
@@ -169,19 +170,17 @@ class TestEvidenceStructure:
 class TestLoadWitnesses:
     """Tests for witness loading functions."""
 
-    def test_load_witnesses_returns_dict(self) -> None:
+    def test_load_witnesses_returns_dict(self, case_001_data: dict[str, Any]) -> None:
         """load_witnesses returns dict keyed by witness ID."""
-        case_data = load_case("case_001")
-        witnesses = load_witnesses(case_data)
+        witnesses = load_witnesses(case_001_data)
 
         assert isinstance(witnesses, dict)
         assert "hermione" in witnesses
         assert "draco" in witnesses
 
-    def test_get_witness_hermione(self) -> None:
+    def test_get_witness_hermione(self, case_001_data: dict[str, Any]) -> None:
         """Get Hermione witness data."""
-        case_data = load_case("case_001")
-        hermione = get_witness(case_data, "hermione")
+        hermione = get_witness(case_001_data, "hermione")
 
         assert hermione["name"] == "Hermione Granger"
         assert hermione["base_trust"] == 55
@@ -190,26 +189,22 @@ class TestLoadWitnesses:
         assert "secrets" in hermione
         assert "lies" in hermione
 
-    def test_get_witness_draco(self) -> None:
+    def test_get_witness_draco(self, case_001_data: dict[str, Any]) -> None:
         """Get Draco witness data."""
-        case_data = load_case("case_001")
-        draco = get_witness(case_data, "draco")
+        draco = get_witness(case_001_data, "draco")
 
         assert draco["name"] == "Draco Malfoy"
         assert draco["base_trust"] == 30
         assert "personality" in draco
 
-    def test_get_witness_not_found_raises(self) -> None:
+    def test_get_witness_not_found_raises(self, case_001_data: dict[str, Any]) -> None:
         """KeyError for missing witness."""
-        case_data = load_case("case_001")
-
         with pytest.raises(KeyError):
-            get_witness(case_data, "voldemort")
+            get_witness(case_001_data, "voldemort")
 
-    def test_list_witnesses(self) -> None:
+    def test_list_witnesses(self, case_001_data: dict[str, Any]) -> None:
         """list_witnesses returns witness IDs."""
-        case_data = load_case("case_001")
-        witness_ids = list_witnesses(case_data)
+        witness_ids = list_witnesses(case_001_data)
 
         assert "hermione" in witness_ids
         assert "draco" in witness_ids
@@ -219,10 +214,9 @@ class TestLoadWitnesses:
 class TestWitnessStructure:
     """Tests for witness data structure."""
 
-    def test_witness_has_required_fields(self) -> None:
+    def test_witness_has_required_fields(self, case_001_data: dict[str, Any]) -> None:
         """Each witness has required fields."""
-        case_data = load_case("case_001")
-        witnesses = load_witnesses(case_data)
+        witnesses = load_witnesses(case_001_data)
 
         required_fields = [
             "id",
@@ -238,29 +232,26 @@ class TestWitnessStructure:
             for field in required_fields:
                 assert field in witness, f"Witness {witness_id} missing '{field}'"
 
-    def test_witness_knowledge_is_list(self) -> None:
+    def test_witness_knowledge_is_list(self, case_001_data: dict[str, Any]) -> None:
         """Witness knowledge is a list of strings."""
-        case_data = load_case("case_001")
-        hermione = get_witness(case_data, "hermione")
+        hermione = get_witness(case_001_data, "hermione")
 
         assert isinstance(hermione["knowledge"], list)
         assert len(hermione["knowledge"]) >= 3
         assert all(isinstance(k, str) for k in hermione["knowledge"])
 
-    def test_witness_secrets_structure(self) -> None:
+    def test_witness_secrets_structure(self, case_001_data: dict[str, Any]) -> None:
         """Witness secrets have id, trigger, text."""
-        case_data = load_case("case_001")
-        hermione = get_witness(case_data, "hermione")
+        hermione = get_witness(case_001_data, "hermione")
 
         for secret in hermione["secrets"]:
             assert "id" in secret, f"Secret missing 'id': {secret}"
             assert "trigger" in secret, f"Secret missing 'trigger': {secret}"
             assert "text" in secret, f"Secret missing 'text': {secret}"
 
-    def test_witness_lies_structure(self) -> None:
+    def test_witness_lies_structure(self, case_001_data: dict[str, Any]) -> None:
         """Witness lies have condition, topics, response."""
-        case_data = load_case("case_001")
-        draco = get_witness(case_data, "draco")
+        draco = get_witness(case_001_data, "draco")
 
         for lie in draco["lies"]:
             assert "condition" in lie, f"Lie missing 'condition': {lie}"
@@ -268,10 +259,9 @@ class TestWitnessStructure:
             assert "response" in lie, f"Lie missing 'response': {lie}"
             assert isinstance(lie["topics"], list)
 
-    def test_hermione_secret_triggers(self) -> None:
+    def test_hermione_secret_triggers(self, case_001_data: dict[str, Any]) -> None:
         """Hermione's secrets have valid triggers."""
-        case_data = load_case("case_001")
-        hermione = get_witness(case_data, "hermione")
+        hermione = get_witness(case_001_data, "hermione")
 
         secret_ids = [s["id"] for s in hermione["secrets"]]
         assert "teaching_neville" in secret_ids
@@ -280,11 +270,10 @@ class TestWitnessStructure:
         saw_fleeing = next(s for s in hermione["secrets"] if s["id"] == "saw_fleeing_figure")
         assert "trust>70" in saw_fleeing["trigger"]
 
-    def test_draco_base_trust_lower_than_hermione(self) -> None:
+    def test_draco_base_trust_lower_than_hermione(self, case_001_data: dict[str, Any]) -> None:
         """Draco starts with lower trust (hostile)."""
-        case_data = load_case("case_001")
-        hermione = get_witness(case_data, "hermione")
-        draco = get_witness(case_data, "draco")
+        hermione = get_witness(case_001_data, "hermione")
+        draco = get_witness(case_001_data, "draco")
 
         assert draco["base_trust"] < hermione["base_trust"]
 
@@ -292,26 +281,23 @@ class TestWitnessStructure:
 class TestWitnessesPresentField:
     """Tests for witnesses_present field in locations."""
 
-    def test_location_has_witnesses_present_field(self) -> None:
+    def test_location_has_witnesses_present_field(self, case_001_copy: dict[str, Any]) -> None:
         """Location includes witnesses_present field."""
-        case_data = load_case("case_001")
-        location = get_location(case_data, "library")
+        location = get_location(case_001_copy, "library")
 
         assert "witnesses_present" in location
         assert isinstance(location["witnesses_present"], list)
 
-    def test_library_has_hermione_present(self) -> None:
+    def test_library_has_hermione_present(self, case_001_copy: dict[str, Any]) -> None:
         """Library has Hermione as witness present."""
-        case_data = load_case("case_001")
-        location = get_location(case_data, "library")
+        location = get_location(case_001_copy, "library")
 
         assert "hermione" in location["witnesses_present"]
 
-    def test_witnesses_present_defaults_to_empty(self) -> None:
+    def test_witnesses_present_defaults_to_empty(self, case_001_copy: dict[str, Any]) -> None:
         """Missing witnesses_present defaults to empty list."""
         # This tests backward compatibility via get_location
-        case_data = load_case("case_001")
-        location = get_location(case_data, "library")
+        location = get_location(case_001_copy, "library")
 
         # Field should exist (either from YAML or default)
         assert "witnesses_present" in location
@@ -320,20 +306,18 @@ class TestWitnessesPresentField:
 class TestEvidenceMetadata:
     """Tests for evidence metadata fields (name, location_found, description)."""
 
-    def test_evidence_has_name_field(self) -> None:
+    def test_evidence_has_name_field(self, case_001_copy: dict[str, Any]) -> None:
         """Each evidence has name field."""
-        case_data = load_case("case_001")
-        location = get_location(case_data, "library")
+        location = get_location(case_001_copy, "library")
 
         for evidence in location["hidden_evidence"]:
             assert "name" in evidence, f"Evidence {evidence['id']} missing 'name'"
             assert isinstance(evidence["name"], str)
             assert len(evidence["name"]) > 0
 
-    def test_evidence_has_location_found_field(self) -> None:
+    def test_evidence_has_location_found_field(self, case_001_copy: dict[str, Any]) -> None:
         """Each evidence has location_found field."""
-        case_data = load_case("case_001")
-        location = get_location(case_data, "library")
+        location = get_location(case_001_copy, "library")
 
         for evidence in location["hidden_evidence"]:
             assert "location_found" in evidence, (
@@ -341,40 +325,36 @@ class TestEvidenceMetadata:
             )
             assert evidence["location_found"] == "library"
 
-    def test_evidence_description_is_detailed(self) -> None:
+    def test_evidence_description_is_detailed(self, case_001_copy: dict[str, Any]) -> None:
         """Evidence descriptions are detailed (multi-sentence)."""
-        case_data = load_case("case_001")
-        location = get_location(case_data, "library")
+        location = get_location(case_001_copy, "library")
 
         for evidence in location["hidden_evidence"]:
             desc = evidence["description"]
             # Should have at least 50 characters for meaningful description
             assert len(desc) >= 50, f"Evidence {evidence['id']} has too short description"
 
-    def test_hidden_note_metadata(self) -> None:
+    def test_hidden_note_metadata(self, case_001_copy: dict[str, Any]) -> None:
         """Hidden note has correct metadata."""
-        case_data = load_case("case_001")
-        location = get_location(case_data, "library")
+        location = get_location(case_001_copy, "library")
 
         hidden_note = next(e for e in location["hidden_evidence"] if e["id"] == "hidden_note")
         assert hidden_note["name"] == "Crumpled Apology Note"
         assert hidden_note["location_found"] == "library"
         assert "hellebore" in hidden_note["description"].lower()
 
-    def test_wand_signature_metadata(self) -> None:
+    def test_wand_signature_metadata(self, case_001_copy: dict[str, Any]) -> None:
         """Wand signature has correct metadata."""
-        case_data = load_case("case_001")
-        location = get_location(case_data, "library")
+        location = get_location(case_001_copy, "library")
 
         wand_sig = next(e for e in location["hidden_evidence"] if e["id"] == "wand_signature")
         assert wand_sig["name"] == "Snape's Wand Signature"
         assert wand_sig["location_found"] == "library"
         assert "finite incantatem" in wand_sig["description"].lower()
 
-    def test_frost_pattern_metadata(self) -> None:
+    def test_frost_pattern_metadata(self, case_001_copy: dict[str, Any]) -> None:
         """Frost pattern has correct metadata."""
-        case_data = load_case("case_001")
-        location = get_location(case_data, "library")
+        location = get_location(case_001_copy, "library")
 
         frost = next(e for e in location["hidden_evidence"] if e["id"] == "frost_pattern")
         assert frost["name"] == "Unusual Frost Pattern"
@@ -385,10 +365,9 @@ class TestEvidenceMetadata:
 class TestGetEvidenceById:
     """Tests for get_evidence_by_id function."""
 
-    def test_get_existing_evidence(self) -> None:
+    def test_get_existing_evidence(self, case_001_data: dict[str, Any]) -> None:
         """Get evidence by ID returns correct data."""
-        case_data = load_case("case_001")
-        evidence = get_evidence_by_id(case_data, "library", "hidden_note")
+        evidence = get_evidence_by_id(case_001_data, "library", "hidden_note")
 
         assert evidence is not None
         assert evidence["id"] == "hidden_note"
@@ -396,17 +375,15 @@ class TestGetEvidenceById:
         assert evidence["location_found"] == "library"
         assert "description" in evidence
 
-    def test_get_nonexistent_evidence(self) -> None:
+    def test_get_nonexistent_evidence(self, case_001_data: dict[str, Any]) -> None:
         """Get evidence returns None for missing ID."""
-        case_data = load_case("case_001")
-        evidence = get_evidence_by_id(case_data, "library", "fake_evidence")
+        evidence = get_evidence_by_id(case_001_data, "library", "fake_evidence")
 
         assert evidence is None
 
-    def test_get_evidence_has_all_fields(self) -> None:
+    def test_get_evidence_has_all_fields(self, case_001_data: dict[str, Any]) -> None:
         """Returned evidence has all metadata fields."""
-        case_data = load_case("case_001")
-        evidence = get_evidence_by_id(case_data, "library", "frost_pattern")
+        evidence = get_evidence_by_id(case_001_data, "library", "frost_pattern")
 
         required_fields = ["id", "name", "location_found", "description", "type", "tag"]
         for field in required_fields:
@@ -416,18 +393,16 @@ class TestGetEvidenceById:
 class TestGetAllEvidence:
     """Tests for get_all_evidence function."""
 
-    def test_get_all_evidence_returns_list(self) -> None:
+    def test_get_all_evidence_returns_list(self, case_001_data: dict[str, Any]) -> None:
         """Get all evidence returns list of evidence."""
-        case_data = load_case("case_001")
-        all_evidence = get_all_evidence(case_data, "library")
+        all_evidence = get_all_evidence(case_001_data, "library")
 
         assert isinstance(all_evidence, list)
         assert len(all_evidence) == 11  # library has 11 evidence items
 
-    def test_all_evidence_has_metadata(self) -> None:
+    def test_all_evidence_has_metadata(self, case_001_data: dict[str, Any]) -> None:
         """All evidence items have required metadata."""
-        case_data = load_case("case_001")
-        all_evidence = get_all_evidence(case_data, "library")
+        all_evidence = get_all_evidence(case_001_data, "library")
 
         for evidence in all_evidence:
             assert "id" in evidence
@@ -443,42 +418,37 @@ class TestGetAllEvidence:
 class TestLoadSolution:
     """Tests for load_solution function."""
 
-    def test_load_solution_returns_dict(self) -> None:
+    def test_load_solution_returns_dict(self, case_001_data: dict[str, Any]) -> None:
         """load_solution returns solution dictionary."""
-        case_data = load_case("case_001")
-        solution = load_solution(case_data)
+        solution = load_solution(case_001_data)
 
         assert isinstance(solution, dict)
 
-    def test_solution_has_culprit(self) -> None:
+    def test_solution_has_culprit(self, case_001_data: dict[str, Any]) -> None:
         """Solution has culprit field."""
-        case_data = load_case("case_001")
-        solution = load_solution(case_data)
+        solution = load_solution(case_001_data)
 
         assert "culprit" in solution
         assert solution["culprit"] == "dobby"
 
-    def test_solution_has_method(self) -> None:
+    def test_solution_has_method(self, case_001_data: dict[str, Any]) -> None:
         """Solution has method field."""
-        case_data = load_case("case_001")
-        solution = load_solution(case_data)
+        solution = load_solution(case_001_data)
 
         assert "method" in solution
         assert "binding" in solution["method"].lower()
 
-    def test_solution_has_key_evidence(self) -> None:
+    def test_solution_has_key_evidence(self, case_001_data: dict[str, Any]) -> None:
         """Solution has key_evidence list."""
-        case_data = load_case("case_001")
-        solution = load_solution(case_data)
+        solution = load_solution(case_001_data)
 
         assert "key_evidence" in solution
         assert isinstance(solution["key_evidence"], list)
         assert "frost_pattern" in solution["key_evidence"]
 
-    def test_solution_has_deductions_required(self) -> None:
+    def test_solution_has_deductions_required(self, case_001_data: dict[str, Any]) -> None:
         """Solution has deductions_required list."""
-        case_data = load_case("case_001")
-        solution = load_solution(case_data)
+        solution = load_solution(case_001_data)
 
         assert "deductions_required" in solution
         assert isinstance(solution["deductions_required"], list)
@@ -488,33 +458,29 @@ class TestLoadSolution:
 class TestLoadWrongSuspects:
     """Tests for load_wrong_suspects function."""
 
-    def test_load_wrong_suspects_returns_dict(self) -> None:
+    def test_load_wrong_suspects_returns_dict(self, case_001_data: dict[str, Any]) -> None:
         """load_wrong_suspects returns dict keyed by suspect ID."""
-        case_data = load_case("case_001")
-        wrong_suspects = load_wrong_suspects(case_data)
+        wrong_suspects = load_wrong_suspects(case_001_data)
 
         assert isinstance(wrong_suspects, dict)
 
-    def test_hermione_in_wrong_suspects(self) -> None:
+    def test_hermione_in_wrong_suspects(self, case_001_data: dict[str, Any]) -> None:
         """Hermione is in wrong suspects dict."""
-        case_data = load_case("case_001")
-        wrong_suspects = load_wrong_suspects(case_data)
+        wrong_suspects = load_wrong_suspects(case_001_data)
 
         assert "hermione" in wrong_suspects
 
-    def test_wrong_suspect_has_why_innocent(self) -> None:
+    def test_wrong_suspect_has_why_innocent(self, case_001_data: dict[str, Any]) -> None:
         """Wrong suspect has why_innocent field."""
-        case_data = load_case("case_001")
-        wrong_suspects = load_wrong_suspects(case_data)
+        wrong_suspects = load_wrong_suspects(case_001_data)
 
         hermione = wrong_suspects["hermione"]
         assert "why_innocent" in hermione
         assert "timeline" in hermione["why_innocent"].lower()
 
-    def test_wrong_suspect_has_moody_response(self) -> None:
+    def test_wrong_suspect_has_moody_response(self, case_001_data: dict[str, Any]) -> None:
         """Wrong suspect has moody_response field."""
-        case_data = load_case("case_001")
-        wrong_suspects = load_wrong_suspects(case_data)
+        wrong_suspects = load_wrong_suspects(case_001_data)
 
         hermione = wrong_suspects["hermione"]
         assert "moody_response" in hermione
@@ -524,53 +490,47 @@ class TestLoadWrongSuspects:
 class TestLoadConfrontation:
     """Tests for load_confrontation function."""
 
-    def test_load_confrontation_correct_verdict(self) -> None:
+    def test_load_confrontation_correct_verdict(self, case_001_data: dict[str, Any]) -> None:
         """Load confrontation for correct verdict."""
-        case_data = load_case("case_001")
-        confrontation = load_confrontation(case_data, "dobby", correct=True)
+        confrontation = load_confrontation(case_001_data, "dobby", correct=True)
 
         assert confrontation is not None
         assert "dialogue" in confrontation
         assert "aftermath" in confrontation
 
-    def test_confrontation_dialogue_structure(self) -> None:
+    def test_confrontation_dialogue_structure(self, case_001_data: dict[str, Any]) -> None:
         """Confrontation dialogue has speaker and text."""
-        case_data = load_case("case_001")
-        confrontation = load_confrontation(case_data, "dobby", correct=True)
+        confrontation = load_confrontation(case_001_data, "dobby", correct=True)
 
         assert len(confrontation["dialogue"]) >= 3
         for entry in confrontation["dialogue"]:
             assert "speaker" in entry
             assert "text" in entry
 
-    def test_confrontation_has_moody(self) -> None:
+    def test_confrontation_has_moody(self, case_001_data: dict[str, Any]) -> None:
         """Confrontation includes Moody dialogue."""
-        case_data = load_case("case_001")
-        confrontation = load_confrontation(case_data, "dobby", correct=True)
+        confrontation = load_confrontation(case_001_data, "dobby", correct=True)
 
         speakers = [d["speaker"] for d in confrontation["dialogue"]]
         assert "moody" in speakers
 
-    def test_confrontation_has_aftermath(self) -> None:
+    def test_confrontation_has_aftermath(self, case_001_data: dict[str, Any]) -> None:
         """Confrontation has aftermath text."""
-        case_data = load_case("case_001")
-        confrontation = load_confrontation(case_data, "dobby", correct=True)
+        confrontation = load_confrontation(case_001_data, "dobby", correct=True)
 
         assert len(confrontation["aftermath"]) > 50
 
-    def test_load_confrontation_incorrect_no_show(self) -> None:
+    def test_load_confrontation_incorrect_no_show(self, case_001_data: dict[str, Any]) -> None:
         """Load confrontation for incorrect verdict without show_anyway returns None."""
-        case_data = load_case("case_001")
         # Mock: if no "confrontation_anyway" defined or False
-        confrontation = load_confrontation(case_data, "unknown_suspect", correct=False)
+        confrontation = load_confrontation(case_001_data, "unknown_suspect", correct=False)
 
         assert confrontation is None
 
-    def test_load_confrontation_incorrect_show_anyway(self) -> None:
+    def test_load_confrontation_incorrect_show_anyway(self, case_001_data: dict[str, Any]) -> None:
         """Load confrontation for incorrect verdict with show_anyway=True."""
-        case_data = load_case("case_001")
         # Hermione has confrontation_anyway: true
-        confrontation = load_confrontation(case_data, "hermione", correct=False)
+        confrontation = load_confrontation(case_001_data, "hermione", correct=False)
 
         assert confrontation is not None
         assert "dialogue" in confrontation
@@ -579,10 +539,9 @@ class TestLoadConfrontation:
 class TestLoadMentorTemplates:
     """Tests for load_mentor_templates function."""
 
-    def test_load_mentor_templates_returns_dict(self) -> None:
+    def test_load_mentor_templates_returns_dict(self, case_001_data: dict[str, Any]) -> None:
         """load_mentor_templates returns dictionary (empty when no templates in YAML)."""
-        case_data = load_case("case_001")
-        templates = load_mentor_templates(case_data)
+        templates = load_mentor_templates(case_001_data)
 
         assert isinstance(templates, dict)
 
@@ -590,40 +549,35 @@ class TestLoadMentorTemplates:
 class TestLoadWrongVerdictInfo:
     """Tests for load_wrong_verdict_info function."""
 
-    def test_load_wrong_verdict_info_existing(self) -> None:
+    def test_load_wrong_verdict_info_existing(self, case_001_data: dict[str, Any]) -> None:
         """Load info for existing wrong suspect."""
-        case_data = load_case("case_001")
-        info = load_wrong_verdict_info(case_data, "hermione")
+        info = load_wrong_verdict_info(case_001_data, "hermione")
 
         assert info is not None
         assert "reveal" in info
         assert "teaching_moment" in info
         assert "confrontation_anyway" in info
 
-    def test_wrong_verdict_info_has_reveal(self) -> None:
+    def test_wrong_verdict_info_has_reveal(self, case_001_data: dict[str, Any]) -> None:
         """Wrong verdict info has reveal text."""
-        case_data = load_case("case_001")
-        info = load_wrong_verdict_info(case_data, "hermione")
+        info = load_wrong_verdict_info(case_001_data, "hermione")
 
         assert "dobby" in info["reveal"].lower()
 
-    def test_wrong_verdict_info_has_teaching_moment(self) -> None:
+    def test_wrong_verdict_info_has_teaching_moment(self, case_001_data: dict[str, Any]) -> None:
         """Wrong verdict info has teaching_moment."""
-        case_data = load_case("case_001")
-        info = load_wrong_verdict_info(case_data, "hermione")
+        info = load_wrong_verdict_info(case_001_data, "hermione")
 
         assert len(info["teaching_moment"]) > 20
 
-    def test_load_wrong_verdict_info_nonexistent(self) -> None:
+    def test_load_wrong_verdict_info_nonexistent(self, case_001_data: dict[str, Any]) -> None:
         """Load info for non-existent wrong suspect returns None."""
-        case_data = load_case("case_001")
-        info = load_wrong_verdict_info(case_data, "unknown_suspect")
+        info = load_wrong_verdict_info(case_001_data, "unknown_suspect")
 
         assert info is None
 
-    def test_load_wrong_verdict_info_case_insensitive(self) -> None:
+    def test_load_wrong_verdict_info_case_insensitive(self, case_001_data: dict[str, Any]) -> None:
         """Load info is case-insensitive."""
-        case_data = load_case("case_001")
-        info = load_wrong_verdict_info(case_data, "HERMIONE")
+        info = load_wrong_verdict_info(case_001_data, "HERMIONE")
 
         assert info is not None
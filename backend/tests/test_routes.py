@@ -1819,7 +1819,7 @@ class TestPhase47SpellSuccessSystem:
             mock_get_client.return_value = mock_client
 
             # Mock success roll
-            with patch("src.context.spell_detection.random.random", return_value=0.5):
+            with patch("src.context.spell_detection._rand", return_value=0.5):
                 await client.post(
                     "/api/investigate",
                     json={
@@ -1851,7 +1851,7 @@ class TestPhase47SpellSuccessSystem:
             mock_client.get_response = AsyncMock(return_value=mock_success_response)
             mock_get_client.return_value = mock_client
 
-            with patch("src.context.spell_detection.random.random", return_value=0.5):
+            with patch("src.context.spell_detection._rand", return_value=0.5):
                 # Cast revelio
                 await client.post(
                     "/api/investigate",
@@ -1892,7 +1892,7 @@ class TestPhase47SpellSuccessSystem:
             mock_client.get_response = AsyncMock(return_value=mock_success_response)
             mock_get_client.return_value = mock_client
 
-            with patch("src.context.spell_detection.random.random", return_value=0.5):
+            with patch("src.context.spell_detection._rand", return_value=0.5):
                 # Cast revelio twice
                 for _ in range(2):
                     await client.post(
@@ -1967,7 +1967,7 @@ class TestPhase47SpellSuccessSystem:
             mock_get_client.return_value = mock_client
 
             # Force success with low roll
-            with patch("src.context.spell_detection.random.random", return_value=0.3):
+            with patch("src.context.spell_detection._rand", return_value=0.3):
                 with patch("src.api.routes.investigation.build_narrator_or_spell_prompt") as mock_build:
                     mock_build.return_value = ("prompt", "system", True)
 
@@ -1998,7 +1998,7 @@ class TestPhase47SpellSuccessSystem:
             mock_get_client.return_value = mock_client
 
             # Force failure with high roll
-            with patch("src.context.spell_detection.random.random", return_value=0.95):
+            with patch("src.context.spell_detection._rand", return_value=0.95):
                 with patch("src.api.routes.investigation.build_narrator_or_spell_prompt") as mock_build:
                     mock_build.return_value = ("prompt", "system", True)
 
@@ -2029,7 +2029,7 @@ class TestPhase47SpellSuccessSystem:
             mock_get_client.return_value = mock_client
 
             # Roll 85 - would fail 70% base, but succeeds with +20% bonus
-            with patch("src.context.spell_detection.random.random", return_value=0.85):
+            with patch("src.context.spell_detection._rand", return_value=0.85):
                 with patch("src.api.routes.investigation.build_narrator_or_spell_prompt") as mock_build:
                     mock_build.return_value = ("prompt", "system", True)
 
@@ -2066,7 +2066,7 @@ class TestPhase47SpellSuccessSystem:
             # 1st: 70% > 65% = SUCCESS
             # 2nd: 60% < 65% = FAILURE
             # 3rd: 50% < 65% = FAILURE
-            with patch("src.context.spell_detection.random.random", return_value=0.65):
+            with patch("src.context.spell_detection._rand", return_value=0.65):
                 for i in range(3):
                     with patch("src.api.routes.investigation.build_narrator_or_spell_prompt") as mock_build:
                         mock_build.return_value = ("prompt", "system", True)
@@ -2110,7 +2110,7 @@ class TestPhase47SpellSuccessSystem:
             mock_get_client.return_value = mock_client
 
             # Roll 5% - below 10% floor = SUCCESS
-            with patch("src.context.spell_detection.random.random", return_value=0.05):
+            with patch("src.context.spell_detection._rand", return_value=0.05):
                 with patch("src.api.routes.investigation.build_narrator_or_spell_prompt") as mock_build:
                     mock_build.return_value = ("prompt", "system", True)
 
@@ -2175,7 +2175,7 @@ class TestPhase47SpellSuccessSystem:
             mock_client.get_response = AsyncMock(return_value=mock_success_response)
             mock_get_client.return_value = mock_client
 
-            with patch("src.context.spell_detection.random.random", return_value=0.5):
+            with patch("src.context.spell_detection._rand", return_value=0.5):
                 for spell in safe_spells:
                     with patch("src.api.routes.investigation.build_narrator_or_spell_prompt") as mock_build:
                         mock_build.return_value = ("prompt", "system", True)
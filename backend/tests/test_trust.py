@@ -1,5 +1,7 @@
 """Tests for trust mechanics module."""
 
+import pytest
+
 from src.utils.trust import (
     NATURAL_WARMING_MAX,
     NATURAL_WARMING_MIN,
@@ -82,6 +84,18 @@ class TestParseTriggerCondition:
         assert len(conditions) == 1  # One AND group
         assert len(conditions[0]["conditions"]) == 2  # Two conditions in group
 
+    def test_parse_is_cached_and_read_only(self) -> None:
+        """Repeated parses reuse one cached parse, which callers cannot mutate."""
+        first = parse_trigger_condition("evidence:hidden_note OR trust>50")
+        assert parse_trigger_condition("evidence:hidden_note OR trust>50") is first
+
+        assert isinstance(first, tuple)
+        assert isinstance(first[0]["conditions"], tuple)
+        with pytest.raises(TypeError):
+            first[0]["conditions"][0]["value"] = "other_evidence"  # type: ignore[index]
+        with pytest.raises(TypeError):
+            first[0]["type"] = "other"  # type: ignore[index]
+
 
 class TestCheckSecretTriggers:
     """Tests for check_secret_triggers function."""
@@ -191,6 +191,19 @@ class TestScoreReasoning:
         # Base 20 + 10 + 20 - 60 = -10 -> 0
         assert score == 0
 
+    def test_duplicate_fallacy_penalized_once(self) -> None:
+        """The same fallacy reported twice only costs -20 once."""
+        reasoning = (
+            "The frost pattern proves guilt clearly. This is obvious because of the evidence shown."
+        )
+        evidence = ["frost_pattern"]
+        solution = {"key_evidence": ["frost_pattern"]}
+
+        fallacies = ["confirmation_bias", "confirmation_bias"]
+        score = score_reasoning(reasoning, evidence, solution, fallacies)
+        # Base 20 + 10 + 20 - 20 = 30
+        assert score == 30
+
     def test_vague_language_penalty(self) -> None:
         """Vague words like 'maybe', 'i guess' get -10 each."""
         reasoning = (
@@ -345,3 +358,8 @@ class TestCalculateAttemptsHintLevel:
     def test_direct_level_0_attempts(self) -> None:
         """0 attempts remaining = direct."""
         assert calculate_attempts_hint_level(0) == "direct"
+
+    def test_out_of_range_attempts_clamped(self) -> None:
+        """Attempts outside 0-10 fall back to the nearest band."""
+        assert calculate_attempts_hint_level(-1) == "direct"
+        assert calculate_attempts_hint_level(12) == "harsh"
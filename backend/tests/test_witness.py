@@ -1,5 +1,9 @@
 """Tests for witness context builder module (Phase 8.0 — Trust + Pressure)."""
 
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+
 import pytest
 
 from src.context.witness import (
@@ -13,10 +17,10 @@ from src.context.witness import (
 )
 
 
-@pytest.fixture
-def sample_witness() -> dict:
-    """Sample witness data for testing."""
-    return {
+@pytest.fixture(scope="module")
+def sample_witness() -> Mapping[str, Any]:
+    """Sample witness data for testing (read-only, shared across the module)."""
+    witness = {
         "id": "hermione",
         "name": "Hermione Granger",
         "personality": "Brilliant student. Values truth and logic.",
@@ -49,6 +53,7 @@ def sample_witness() -> dict:
             },
         ],
     }
+    return MappingProxyType(witness)
 
 
 class TestFormatKnowledge:
@@ -152,7 +157,7 @@ class TestDescribePressure:
 class TestBuildWitnessPrompt:
     """Tests for build_witness_prompt function."""
 
-    def test_prompt_contains_witness_name(self, sample_witness: dict) -> None:
+    def test_prompt_contains_witness_name(self, sample_witness: Mapping[str, Any]) -> None:
         prompt = build_witness_prompt(
             witness=sample_witness,
             trust=50,
@@ -162,7 +167,7 @@ class TestBuildWitnessPrompt:
         )
         assert "Hermione Granger" in prompt
 
-    def test_prompt_contains_personality(self, sample_witness: dict) -> None:
+    def test_prompt_contains_personality(self, sample_witness: Mapping[str, Any]) -> None:
         prompt = build_witness_prompt(
             witness=sample_witness,
             trust=50,
@@ -172,7 +177,7 @@ class TestBuildWitnessPrompt:
         )
         assert "Brilliant student" in prompt
 
-    def test_prompt_contains_knowledge(self, sample_witness: dict) -> None:
+    def test_prompt_contains_knowledge(self, sample_witness: Mapping[str, Any]) -> None:
         prompt = build_witness_prompt(
             witness=sample_witness,
             trust=50,
@@ -182,7 +187,7 @@ class TestBuildWitnessPrompt:
         )
         assert "library from 8:30pm" in prompt
 
-    def test_prompt_contains_trust_and_pressure(self, sample_witness: dict) -> None:
+    def test_prompt_contains_trust_and_pressure(self, sample_witness: Mapping[str, Any]) -> None:
         """Prompt includes both trust and pressure as numbers."""
         prompt = build_witness_prompt(
             witness=sample_witness,
@@ -197,7 +202,7 @@ class TestBuildWitnessPrompt:
         assert "Pressure: 150" in prompt
         assert "Stance:" in prompt
 
-    def test_prompt_contains_player_input(self, sample_witness: dict) -> None:
+    def test_prompt_contains_player_input(self, sample_witness: Mapping[str, Any]) -> None:
         prompt = build_witness_prompt(
             witness=sample_witness,
             trust=50,
@@ -213,7 +218,7 @@ class TestBuildWitnessPrompt:
         assert "Low trust + low pressure" in prompt
         assert "High trust + high pressure" in prompt
 
-    def test_secrets_always_full_text(self, sample_witness: dict) -> None:
+    def test_secrets_always_full_text(self, sample_witness: Mapping[str, Any]) -> None:
         """Secrets include full text at ANY trust level (no compression)."""
         prompt = build_witness_prompt(
             witness=sample_witness,
@@ -225,7 +230,7 @@ class TestBuildWitnessPrompt:
         assert "saw Draco near the window" in prompt
         assert "borrowed a restricted book" in prompt
 
-    def test_no_mandatory_lie_system(self, sample_witness: dict) -> None:
+    def test_no_mandatory_lie_system(self, sample_witness: Mapping[str, Any]) -> None:
         """No MANDATORY LIE or COVER STORY section — LLM decides from trust+pressure."""
         prompt = build_witness_prompt(
             witness=sample_witness,
@@ -238,7 +243,7 @@ class TestBuildWitnessPrompt:
         assert "COVER STORY" not in prompt
         assert "MUST respond with" not in prompt
 
-    def test_evidence_presented_in_prompt(self, sample_witness: dict) -> None:
+    def test_evidence_presented_in_prompt(self, sample_witness: Mapping[str, Any]) -> None:
         """Evidence presentation adds section to prompt."""
         prompt = build_witness_prompt(
             witness=sample_witness,
@@ -257,7 +262,7 @@ class TestBuildWitnessPrompt:
         assert "gut reaction" in prompt
         assert "*eyes widen*" in prompt
 
-    def test_evidence_shown_list_in_prompt(self, sample_witness: dict) -> None:
+    def test_evidence_shown_list_in_prompt(self, sample_witness: Mapping[str, Any]) -> None:
         """Previously shown evidence listed in prompt."""
         prompt = build_witness_prompt(
             witness=sample_witness,
@@ -274,7 +279,7 @@ class TestBuildWitnessPrompt:
         assert "Torn Letter" in prompt
         assert "implicates YOU" in prompt
 
-    def test_pressure_description_in_prompt(self, sample_witness: dict) -> None:
+    def test_pressure_description_in_prompt(self, sample_witness: Mapping[str, Any]) -> None:
         """Pressure is described in natural language."""
         prompt = build_witness_prompt(
             witness=sample_witness,
@@ -314,11 +319,16 @@ class TestBuildWitnessSystemPrompt:
         assert "first person" in prompt.lower()
         assert "2-4 sentences" in prompt
 
+    def test_system_prompt_cached_per_name(self) -> None:
+        prompt = build_witness_system_prompt("Hermione Granger")
+        assert build_witness_system_prompt("Hermione Granger") is prompt
+        assert build_witness_system_prompt("Draco Malfoy") is not prompt
+
 
 class TestPromptIntegration:
     """Integration tests for witness prompts."""
 
-    def test_full_prompt_structure(self, sample_witness: dict) -> None:
+    def test_full_prompt_structure(self, sample_witness: Mapping[str, Any]) -> None:
         """Full prompt has all expected sections."""
         prompt = build_witness_prompt(
             witness=sample_witness,
@@ -7,12 +7,13 @@ Tests:
 - Backward compatibility with existing case_001.yaml
 """
 
+from collections.abc import Iterable, Mapping
+from types import MappingProxyType
+from typing import Any
+
 import pytest
 
-from src.case_store.loader import (
-    load_case,
-    validate_case,
-)
+from src.case_store.loader import validate_case
 from src.context.mentor import (
     format_common_mistakes,
     format_fallacies_to_catch,
@@ -195,13 +196,38 @@ class TestSolutionEnhancedModel:
 # ============================================================================
 
 
+# Minimal valid case section (read-only); validator tests override one field at a time
+_BASE_MOCK_CASE: Mapping[str, Any] = MappingProxyType(
+    {
+        "id": "test_case",
+        "title": "Test",
+        "difficulty": "beginner",
+        "locations": {"room": {"hidden_evidence": [{"id": "e1"}]}},
+        "witnesses": [{"id": "w1"}],
+        "solution": {"culprit": "w1"},
+        "briefing": {
+            "case_assignment": "Test",
+            "teaching_question": "Test?",
+        },
+    }
+)
+
+
+def _mock_case(**case_fields: Any) -> dict[str, Any]:
+    """Return a mock case dict: the base case section with top-level fields overridden.
+
+    Copies shallowly; untouched nested values are shared, which is safe because
+    validate_case only reads its input.
+    """
+    return {"case": {**_BASE_MOCK_CASE, **case_fields}}
+
+
 class TestValidateCase:
     """Tests for validate_case with Phase 5.5 checks."""
 
-    def test_validate_case_returns_three_tuple(self) -> None:
+    def test_validate_case_returns_three_tuple(self, case_001_data: dict[str, Any]) -> None:
         """validate_case now returns (is_valid, errors, warnings)."""
-        case_data = load_case("case_001")
-        result = validate_case(case_data, "case_001")
+        result = validate_case(case_001_data, "case_001")
 
         assert len(result) == 3
         is_valid, errors, warnings = result
@@ -209,106 +235,49 @@ class TestValidateCase:
         assert isinstance(errors, list)
         assert isinstance(warnings, list)
 
-    def test_validate_case_backward_compatible(self) -> None:
+    def test_validate_case_backward_compatible(self, case_001_data: dict[str, Any]) -> None:
         """case_001 without new fields still passes validation."""
-        case_data = load_case("case_001")
-        is_valid, errors, warnings = validate_case(case_data, "case_001")
+        is_valid, errors, warnings = validate_case(case_001_data, "case_001")
 
         assert is_valid is True, f"Expected valid, got errors: {errors}"
 
-    def test_validate_victim_name_required_if_present(self) -> None:
-        """Victim section requires name if present."""
-        mock_case = {
-            "case": {
-                "id": "test_case",
-                "title": "Test",
-                "difficulty": "beginner",
-                "locations": {"room": {"hidden_evidence": [{"id": "e1"}]}},
-                "witnesses": [{"id": "w1"}],
-                "solution": {"culprit": "w1"},
-                "briefing": {
-                    "case_assignment": "Test",
-                    "teaching_question": "Test?",
-                },
-                "victim": {"humanization": "No name given"},  # Missing name!
-            }
-        }
-        is_valid, errors, warnings = validate_case(mock_case, "test_case")
-
-        assert is_valid is False
-        assert any("victim.name" in e for e in errors)
-
-    def test_validate_wants_fears_consistency(self) -> None:
-        """Wants without fears (or vice versa) is an error."""
-        mock_case = {
-            "case": {
-                "id": "test_case",
-                "title": "Test",
-                "difficulty": "beginner",
-                "locations": {"room": {"hidden_evidence": [{"id": "e1"}]}},
-                "witnesses": [
-                    {"id": "w1", "wants": "something", "fears": ""},  # Wants but no fears
-                ],
-                "solution": {"culprit": "w1"},
-                "briefing": {
-                    "case_assignment": "Test",
-                    "teaching_question": "Test?",
-                },
-            }
-        }
-        is_valid, errors, warnings = validate_case(mock_case, "test_case")
+    def test_base_mock_case_is_valid(self) -> None:
+        """Unmodified base mock case passes, so each failure below is its override."""
+        is_valid, errors, warnings = validate_case(_mock_case(), "test_case")
 
-        assert is_valid is False
-        assert any("wants specified but fears missing" in e for e in errors)
-
-    def test_validate_evidence_strength_range(self) -> None:
-        """Evidence strength must be 0-100 if present."""
-        mock_case = {
-            "case": {
-                "id": "test_case",
-                "title": "Test",
-                "difficulty": "beginner",
-                "locations": {
-                    "room": {
-                        "hidden_evidence": [{"id": "e1", "strength": 150}]  # Invalid!
-                    }
-                },
-                "witnesses": [{"id": "w1"}],
-                "solution": {"culprit": "w1"},
-                "briefing": {
-                    "case_assignment": "Test",
-                    "teaching_question": "Test?",
-                },
-            }
-        }
-        is_valid, errors, warnings = validate_case(mock_case, "test_case")
+        assert is_valid is True, f"Expected valid, got errors: {errors}"
 
-        assert is_valid is False
-        assert any("strength must be integer 0-100" in e for e in errors)
-
-    def test_validate_timeline_requires_time_event(self) -> None:
-        """Timeline entries must have time and event."""
-        mock_case = {
-            "case": {
-                "id": "test_case",
-                "title": "Test",
-                "difficulty": "beginner",
-                "locations": {"room": {"hidden_evidence": [{"id": "e1"}]}},
-                "witnesses": [{"id": "w1"}],
-                "solution": {"culprit": "w1"},
-                "briefing": {
-                    "case_assignment": "Test",
-                    "teaching_question": "Test?",
-                },
-                "timeline": [
-                    {"time": "", "event": "Something"},  # Missing time!
-                ],
-            }
-        }
-        is_valid, errors, warnings = validate_case(mock_case, "test_case")
+    @pytest.mark.parametrize(
+        ("case_fields", "expected_error"),
+        [
+            pytest.param(
+                {"victim": {"humanization": "No name given"}},  # Missing name!
+                "victim.name",
+                id="victim_name_required_if_present",
+            ),
+            pytest.param(
+                {"witnesses": [{"id": "w1", "wants": "something", "fears": ""}]},
+                "wants specified but fears missing",
+                id="wants_fears_consistency",
+            ),
+            pytest.param(
+                {"locations": {"room": {"hidden_evidence": [{"id": "e1", "strength": 150}]}}},
+                "strength must be integer 0-100",
+                id="evidence_strength_range",
+            ),
+            pytest.param(
+                {"timeline": [{"time": "", "event": "Something"}]},  # Missing time!
+                "missing required field 'time'",
+                id="timeline_requires_time_event",
+            ),
+        ],
+    )
+    def test_validate_phase55_error(self, case_fields: dict[str, Any], expected_error: str) -> None:
+        """Each Phase 5.5 violation on an otherwise valid case is reported as an error."""
+        is_valid, errors, warnings = validate_case(_mock_case(**case_fields), "test_case")
 
         assert is_valid is False
-        assert any("missing required field 'time'" in e for e in errors)
+        assert expected_error in "\n".join(errors)
 
 
 # ============================================================================
@@ -316,6 +285,12 @@ class TestValidateCase:
 # ============================================================================
 
 
+def _assert_all_in(text: str, needles: Iterable[str]) -> None:
+    """Assert every needle appears in text, reporting all missing ones at once."""
+    missing = [needle for needle in needles if needle not in text]
+    assert not missing, f"Missing {missing} in:\n{text}"
+
+
 class TestNarratorFormatters:
     """Tests for narrator.py Phase 5.5 formatters."""
 
@@ -328,9 +303,7 @@ class TestNarratorFormatters:
         }
         result = format_victim_context(victim)
 
-        assert "Marcus Webb" in result
-        assert "brilliant student" in result
-        assert "Freezing curse" in result
+        _assert_all_in(result, ["Marcus Webb", "brilliant student", "Freezing curse"])
 
     def test_format_victim_context_empty_if_no_humanization(self) -> None:
         """format_victim_context returns empty if no humanization."""
@@ -351,9 +324,7 @@ class TestNarratorFormatters:
         ]
         result = format_hidden_evidence(evidence, [])
 
-        assert "frost_pattern" in result
-        assert "Strategic significance" in result
-        assert "Proves freezing curse" in result
+        _assert_all_in(result, ["frost_pattern", "Strategic significance", "Proves freezing curse"])
 
 
 class TestWitnessFormatters:
@@ -367,10 +338,7 @@ class TestWitnessFormatters:
             moral_complexity="She knows something but fears revealing it.",
         )
 
-        assert "You want" in result
-        assert "clear her name" in result
-        assert "You fear" in result
-        assert "Internal conflict" in result
+        _assert_all_in(result, ["You want", "clear her name", "You fear", "Internal conflict"])
 
     def test_format_wants_fears_empty_if_none(self) -> None:
         """format_wants_fears returns empty if no depth fields."""
@@ -392,9 +360,7 @@ class TestMentorFormatters:
         ]
         result = format_common_mistakes(mistakes)
 
-        assert "Accusing Hermione" in result
-        assert "Why players make this" in result
-        assert "Why it's wrong" in result
+        _assert_all_in(result, ["Accusing Hermione", "Why players make this", "Why it's wrong"])
 
     def test_format_fallacies_to_catch(self) -> None:
         """format_fallacies_to_catch formats fallacy list."""
@@ -403,8 +369,7 @@ class TestMentorFormatters:
         ]
         result = format_fallacies_to_catch(fallacies)
 
-        assert "Confirmation bias" in result
-        assert "Ignoring alibi" in result
+        _assert_all_in(result, ["Confirmation bias", "Ignoring alibi"])
 
     def test_format_timeline(self) -> None:
         """format_timeline formats timeline entries."""
@@ -413,9 +378,7 @@ class TestMentorFormatters:
         ]
         result = format_timeline(timeline)
 
-        assert "10:00 PM" in result
-        assert "Victim enters" in result
-        assert "filch" in result
+        _assert_all_in(result, ["10:00 PM", "Victim enters", "filch"])
 
 
 class TestTomFormatters:
@@ -429,9 +392,7 @@ class TestTomFormatters:
         ]
         result = format_evidence_by_strength(evidence)
 
-        assert "STRONG EVIDENCE" in result
-        assert "CRITICAL" in result
-        assert "WEAK/CIRCUMSTANTIAL" in result
+        _assert_all_in(result, ["STRONG EVIDENCE", "CRITICAL", "WEAK/CIRCUMSTANTIAL"])
 
     def test_format_victim_for_tom_emotional(self) -> None:
         """format_victim_for_tom includes emotional hook."""
@@ -441,9 +402,14 @@ class TestTomFormatters:
         }
         result = format_victim_for_tom(victim)
 
-        assert "Marcus Webb" in result
-        assert "Marcus" in result  # Connection to Tom's story
-        assert "kind student" in result
+        _assert_all_in(
+            result,
+            [
+                "Marcus Webb",
+                "Marcus",  # Connection to Tom's story
+                "kind student",
+            ],
+        )
 
     def test_format_victim_for_tom_empty_if_no_name(self) -> None:
         """format_victim_for_tom returns empty if no victim name."""